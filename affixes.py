@@ -0,0 +1,287 @@
+"""Parse Hunspell affix (.aff) rules and apply them to expand stems."""
+
+# Standard library
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+# Compiled condition regexes keyed by (kind, condition). Many rules across
+# different flags share a condition (e.g. SFX "[^aeiou]y"), and they all
+# share one pattern object from here.
+_PATTERN_CACHE: dict[tuple[str, str], re.Pattern[str]] = {}
+
+
+@dataclass
+class AffixRule:
+    """A single affix rule (one line of a PFX/SFX block)."""
+
+    strip: str  # Characters to strip from the stem ("" for none; "0" in .aff)
+    add: str  # Characters to add ("" for none; "0" in .aff)
+    condition: str  # Regex-style condition the stem must match
+    # How apply_affix tests the condition: "any", "literal" or "regex"
+    cond_kind: str = "regex"
+    pattern: re.Pattern[str] | None = None  # Compiled condition, set by parser
+
+
+# A rule packed into a flat tuple for apply_affix: (strip, add, cond_kind,
+# test), where test is the condition text for "literal" rules and the
+# compiled pattern for "regex" rules (None for "any")
+PackedRule = tuple[str, str, str, "str | re.Pattern[str] | None"]
+
+
+@dataclass
+class AffixGroup:
+    """A group of affix rules sharing one flag character.
+
+    Alongside the readable AffixRule list, the group keeps each rule packed
+    into a flat tuple. apply_affix unpacks those in a single step instead of
+    doing several attribute lookups per rule, in the hottest loop of the
+    conversion. Always add rules with add_rule so the two stay in sync.
+    """
+
+    kind: str  # "PFX" or "SFX"
+    flag: str  # Single-character flag
+    cross_product: bool  # Whether this can combine with other affixes
+    rules: list[AffixRule] = field(default_factory=list)
+    packed: list[PackedRule] = field(default_factory=list, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        rules, self.rules = self.rules, []
+        for rule in rules:
+            self.add_rule(rule)
+
+    def add_rule(self, rule: AffixRule) -> None:
+        """Append a rule to the group, packing it for apply_affix."""
+        test: str | re.Pattern[str] | None = None
+        if rule.cond_kind == "literal":
+            test = rule.condition
+        elif rule.cond_kind == "regex":
+            test = rule.pattern or _condition_to_regex(rule.condition, self.kind)
+        self.rules.append(rule)
+        self.packed.append((rule.strip, rule.add, rule.cond_kind, test))
+
+
+@dataclass
+class AffData:
+    """All parsed data from a Hunspell .aff file."""
+
+    affix_groups: dict[str, AffixGroup]
+    nosuggest_flag: str  # Flag character for NOSUGGEST (profanity), "" if none
+    onlyincompound_flag: str  # Flag character for ONLYINCOMPOUND, "" if none
+    # affix_groups split by kind, so expansion needn't check .kind per flag
+    prefix_groups: dict[str, AffixGroup] = field(init=False, repr=False)
+    suffix_groups: dict[str, AffixGroup] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        groups = self.affix_groups
+        self.prefix_groups = {f: g for f, g in groups.items() if g.kind == "PFX"}
+        self.suffix_groups = {f: g for f, g in groups.items() if g.kind == "SFX"}
+
+
+def parse_aff_file(aff_path: Path) -> AffData:
+    """Parse a Hunspell .aff file and return affix data.
+
+    Parses PFX/SFX rules plus NOSUGGEST and ONLYINCOMPOUND flags.
+    Other directives (REP, COMPOUNDRULE, etc.) are ignored since they
+    aren't needed for word expansion.
+
+    Args:
+        aff_path: Path to the .aff file.
+
+    Returns:
+        AffData containing affix groups and special flag characters.
+    """
+    groups: dict[str, AffixGroup] = {}
+    nosuggest_flag = ""
+    onlyincompound_flag = ""
+
+    with open(aff_path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+
+            parts = line.split()
+            if len(parts) < 2:
+                continue
+
+            directive = parts[0]
+
+            if directive == "NOSUGGEST":
+                nosuggest_flag = parts[1]
+                continue
+            if directive == "ONLYINCOMPOUND":
+                onlyincompound_flag = parts[1]
+                continue
+
+            if directive not in ("PFX", "SFX"):
+                continue
+
+            flag = parts[1]
+
+            # Header line: PFX/SFX flag cross_product count
+            if len(parts) == 4 and parts[3].isdigit():
+                cross = parts[2] == "Y"
+                groups[flag] = AffixGroup(
+                    kind=directive, flag=flag, cross_product=cross
+                )
+                continue
+
+            # Rule line: PFX/SFX flag strip add condition
+            if len(parts) >= 5 and flag in groups:
+                # "0" is Hunspell's placeholder for an empty strip/add
+                strip = "" if parts[2] == "0" else parts[2]
+                add = "" if parts[3] == "0" else parts[3]
+                condition = parts[4]
+                cond_kind = _classify_condition(condition)
+                pattern = None
+                if cond_kind == "regex":
+                    pattern = _condition_to_regex(condition, directive)
+                groups[flag].add_rule(
+                    AffixRule(
+                        strip=strip,
+                        add=add,
+                        condition=condition,
+                        cond_kind=cond_kind,
+                        pattern=pattern,
+                    )
+                )
+
+    return AffData(
+        affix_groups=groups,
+        nosuggest_flag=nosuggest_flag,
+        onlyincompound_flag=onlyincompound_flag,
+    )
+
+
+def _classify_condition(condition: str) -> str:
+    """Pick the cheapest way for apply_affix to test a Hunspell condition.
+
+    Args:
+        condition: Hunspell condition (e.g. ".", "[^aeiou]y", "e").
+
+    Returns:
+        "any" for ".", "literal" for plain letters such as "e" or "ee"
+        (tested with str.endswith/startswith), otherwise "regex".
+    """
+    if condition == ".":
+        return "any"
+    if condition.isalpha():
+        return "literal"
+    return "regex"
+
+
+def _condition_to_regex(condition: str, kind: str) -> re.Pattern[str]:
+    """Convert a Hunspell condition string to a compiled regex.
+
+    Each distinct (kind, condition) pair is compiled once and interned in
+    _PATTERN_CACHE.
+
+    Args:
+        condition: Hunspell condition (e.g. ".", "[^aeiou]y", "e").
+        kind: "PFX" or "SFX" — determines anchoring.
+
+    Returns:
+        Compiled regex pattern.
+    """
+    key = (kind, condition)
+    pattern = _PATTERN_CACHE.get(key)
+    if pattern is not None:
+        return pattern
+
+    if condition == ".":
+        # Matches anything
+        source = "."
+    # The condition is already mostly regex-compatible.
+    # Anchor it to the start (prefix) or end (suffix) of the word.
+    elif kind == "PFX":
+        source = "^" + condition
+    else:
+        source = condition + "$"
+
+    pattern = _PATTERN_CACHE[key] = re.compile(source)
+    return pattern
+
+
+def apply_affix(stem: str, group: AffixGroup) -> list[str]:
+    """Apply all rules in an affix group to a stem.
+
+    Args:
+        stem: The base word to apply affixes to.
+        group: The affix group containing the rules.
+
+    Returns:
+        List of new words produced by applying matching rules.
+    """
+    results = []
+
+    # This is the innermost loop of the whole conversion, so the kind test
+    # is hoisted out, rules are read from the group's packed tuples, and
+    # each branch only does its own string operations
+    if group.kind == "SFX":
+        for strip, add, cond_kind, test in group.packed:
+            if cond_kind == "literal":
+                if not stem.endswith(test):
+                    continue
+            elif cond_kind == "regex" and not test.search(stem):
+                continue
+            if not strip:
+                results.append(stem + add)
+            elif stem.endswith(strip):
+                results.append(stem[: -len(strip)] + add)
+    else:  # PFX
+        for strip, add, cond_kind, test in group.packed:
+            if cond_kind == "literal":
+                if not stem.startswith(test):
+                    continue
+            elif cond_kind == "regex" and not test.search(stem):
+                continue
+            if not strip:
+                results.append(add + stem)
+            elif stem.startswith(strip):
+                results.append(add + stem[len(strip) :])
+
+    return results
+
+
+def expand_word(stem: str, flags: str, aff_data: AffData) -> set[str]:
+    """Expand a stem with its affix flags into all possible word forms.
+
+    Handles single prefixes, single suffixes, and cross-product
+    combinations (prefix + suffix applied together).
+
+    Args:
+        stem: The base word.
+        flags: String of single-character affix flags.
+        aff_data: Parsed .aff data (uses its prefix/suffix group dicts).
+
+    Returns:
+        Set of all expanded words, including the stem itself.
+    """
+    # Flags with no affix group (e.g. NOSUGGEST) are in neither dict
+    all_prefixes = aff_data.prefix_groups
+    all_suffixes = aff_data.suffix_groups
+    prefix_groups = [all_prefixes[f] for f in flags if f in all_prefixes]
+    suffix_groups = [all_suffixes[f] for f in flags if f in all_suffixes]
+
+    # Collect everything in a list and hash it into a set once at the end
+    words = [stem]
+
+    # Apply each suffix to the stem, tracking which allow cross-product
+    crossable_suffixed: list[str] = []
+    for sfx_group in suffix_groups:
+        new_words = apply_affix(stem, sfx_group)
+        words.extend(new_words)
+        if sfx_group.cross_product:
+            crossable_suffixed.extend(new_words)
+
+    # Apply each prefix to the stem
+    for pfx_group in prefix_groups:
+        words.extend(apply_affix(stem, pfx_group))
+
+        # Cross-product: only combine prefix+suffix when BOTH allow it
+        if pfx_group.cross_product:
+            for sfx_word in crossable_suffixed:
+                words.extend(apply_affix(sfx_word, pfx_group))
+
+    return set(words)
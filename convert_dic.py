@@ -1,38 +1,20 @@
 """Convert a Hunspell .dic + .aff file pair to a plain text wordlist."""
 
 # Standard library
-import re
+import itertools
+import os
 import sys
-from dataclasses import dataclass, field
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
+# Local imports
+from affixes import AffData, expand_word, parse_aff_file
 
-@dataclass
-class AffixRule:
-    """A single affix rule (one line of a PFX/SFX block)."""
-
-    strip: str  # Characters to strip from the stem ("0" means none)
-    add: str  # Characters to add
-    condition: str  # Regex-style condition the stem must match
-
-
-@dataclass
-class AffixGroup:
-    """A group of affix rules sharing one flag character."""
-
-    kind: str  # "PFX" or "SFX"
-    flag: str  # Single-character flag
-    cross_product: bool  # Whether this can combine with other affixes
-    rules: list[AffixRule] = field(default_factory=list)
-
-
-@dataclass
-class AffData:
-    """All parsed data from a Hunspell .aff file."""
-
-    affix_groups: dict[str, AffixGroup]
-    nosuggest_flag: str  # Flag character for NOSUGGEST (profanity), "" if none
-    onlyincompound_flag: str  # Flag character for ONLYINCOMPOUND, "" if none
+# Number of .dic entries sent to a worker process at a time
+_BATCH_SIZE = 2000
 
 
 @dataclass
@@ -45,198 +27,118 @@ class WordlistResult:
     profanity: list[str]  # NOSUGGEST words (sorted, alpha-only)
 
 
-def parse_aff_file(aff_path: Path) -> AffData:
-    """Parse a Hunspell .aff file and return affix data.
-
-    Parses PFX/SFX rules plus NOSUGGEST and ONLYINCOMPOUND flags.
-    Other directives (REP, COMPOUNDRULE, etc.) are ignored since they
-    aren't needed for word expansion.
-
-    Args:
-        aff_path: Path to the .aff file.
-
-    Returns:
-        AffData containing affix groups and special flag characters.
-    """
-    groups: dict[str, AffixGroup] = {}
-    nosuggest_flag = ""
-    onlyincompound_flag = ""
-
-    with open(aff_path, encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-
-            parts = line.split()
-            if len(parts) < 2:
-                continue
-
-            directive = parts[0]
+def _is_acronym(stem: str) -> bool:
+    """Check if a stem is an acronym (all caps, e.g. "ABC")."""
+    return len(stem) > 1 and stem.isupper()
 
-            if directive == "NOSUGGEST":
-                nosuggest_flag = parts[1]
-                continue
-            if directive == "ONLYINCOMPOUND":
-                onlyincompound_flag = parts[1]
-                continue
 
-            if directive not in ("PFX", "SFX"):
-                continue
+def _has_uppercase(stem: str) -> bool:
+    """Check if a stem contains any uppercase letter."""
+    # One C-level lower() + compare instead of a per-character generator
+    return stem != stem.lower()
 
-            flag = parts[1]
 
-            # Header line: PFX/SFX flag cross_product count
-            if len(parts) == 4 and parts[3].isdigit():
-                cross = parts[2] == "Y"
-                groups[flag] = AffixGroup(
-                    kind=directive, flag=flag, cross_product=cross
-                )
-                continue
+def _filter_alpha(word_set: set[str]) -> set[str]:
+    """Keep alpha-only words with length >= 2, preserving original case."""
+    # filter() runs str.isalpha from C, so only the length check is bytecode
+    return {w for w in filter(str.isalpha, word_set) if len(w) >= 2}
 
-            # Rule line: PFX/SFX flag strip add condition
-            if len(parts) >= 5 and flag in groups:
-                strip = parts[2]
-                add = parts[3]
-                condition = parts[4]
-                groups[flag].rules.append(
-                    AffixRule(strip=strip, add=add, condition=condition)
-                )
-
-    return AffData(
-        affix_groups=groups,
-        nosuggest_flag=nosuggest_flag,
-        onlyincompound_flag=onlyincompound_flag,
-    )
 
+def _sorted_casefold(word_set: set[str]) -> list[str]:
+    """Sort words case-insensitively, breaking ties (e.g. "TeX"/"Tex") by case."""
+    # A plain sort first makes the order of casefold ties independent of set
+    # iteration order; the stable keyed sort then keeps that order for ties
+    ordered = sorted(word_set)
+    ordered.sort(key=str.casefold)
+    return ordered
 
-def _condition_to_regex(condition: str, kind: str) -> re.Pattern[str]:
-    """Convert a Hunspell condition string to a compiled regex.
 
-    Args:
-        condition: Hunspell condition (e.g. ".", "[^aeiou]y", "e").
-        kind: "PFX" or "SFX" — determines anchoring.
+def _read_dic_entries(
+    dic_path: Path, onlyincompound_flag: str
+) -> Iterator[tuple[str, str]]:
+    """Stream (stem, flags) pairs from a .dic file.
 
-    Returns:
-        Compiled regex pattern.
+    Skips the leading word-count line, blank lines, and stems flagged
+    ONLYINCOMPOUND (e.g. "1th", "2th", "3th").
     """
-    if condition == ".":
-        # Matches anything
-        return re.compile(".")
-
-    # The condition is already mostly regex-compatible.
-    # Anchor it to the start (prefix) or end (suffix) of the word.
-    if kind == "PFX":
-        return re.compile("^" + condition)
-    else:
-        return re.compile(condition + "$")
-
-
-def apply_affix(stem: str, group: AffixGroup) -> list[str]:
-    """Apply all rules in an affix group to a stem.
+    with open(dic_path, encoding="utf-8") as f:
+        # First line is the word count — skip it
+        next(f, None)
 
-    Args:
-        stem: The base word to apply affixes to.
-        group: The affix group containing the rules.
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
 
-    Returns:
-        List of new words produced by applying matching rules.
-    """
-    results = []
-
-    for rule in group.rules:
-        pattern = _condition_to_regex(rule.condition, group.kind)
-        if not pattern.search(stem):
-            continue
-
-        strip = "" if rule.strip == "0" else rule.strip
-        add = "" if rule.add == "0" else rule.add
-
-        if group.kind == "SFX":
-            if strip:
-                if stem.endswith(strip):
-                    new_word = stem[: -len(strip)] + add
-                else:
-                    continue
+            # Split into stem and flags
+            if "/" in line:
+                stem, flags = line.split("/", 1)
             else:
-                new_word = stem + add
-        else:  # PFX
-            if strip:
-                if stem.startswith(strip):
-                    new_word = add + stem[len(strip) :]
-                else:
-                    continue
-            else:
-                new_word = add + stem
-
-        results.append(new_word)
-
-    return results
-
-
-def expand_word(
-    stem: str, flags: str, affix_groups: dict[str, AffixGroup]
-) -> set[str]:
-    """Expand a stem with its affix flags into all possible word forms.
-
-    Handles single prefixes, single suffixes, and cross-product
-    combinations (prefix + suffix applied together).
-
-    Args:
-        stem: The base word.
-        flags: String of single-character affix flags.
-        affix_groups: All parsed affix groups from the .aff file.
-
-    Returns:
-        Set of all expanded words, including the stem itself.
-    """
-    words = {stem}
+                stem, flags = line, ""
 
-    prefix_groups = []
-    suffix_groups = []
+            if onlyincompound_flag and onlyincompound_flag in flags:
+                continue
 
-    for flag in flags:
-        group = affix_groups.get(flag)
-        if group is None:
-            continue
-        if group.kind == "PFX":
-            prefix_groups.append(group)
-        else:
-            suffix_groups.append(group)
+            yield stem, flags
 
-    # Apply each suffix to the stem, tracking which allow cross-product
-    crossable_suffixed: list[str] = []
-    for sfx_group in suffix_groups:
-        new_words = apply_affix(stem, sfx_group)
-        words.update(new_words)
-        if sfx_group.cross_product:
-            crossable_suffixed.extend(new_words)
 
-    # Apply each prefix to the stem
-    for pfx_group in prefix_groups:
-        new_words = apply_affix(stem, pfx_group)
-        words.update(new_words)
+# Parsed .aff data for the current worker process, set once by _init_worker so
+# it isn't pickled again with every batch
+_worker_aff_data: AffData | None = None
 
-        # Cross-product: only combine prefix+suffix when BOTH allow it
-        if pfx_group.cross_product:
-            for sfx_word in crossable_suffixed:
-                cross_words = apply_affix(sfx_word, pfx_group)
-                words.update(cross_words)
 
-    return words
+def _init_worker(aff_data: AffData) -> None:
+    """ProcessPoolExecutor initializer: store the .aff data globally."""
+    global _worker_aff_data
+    _worker_aff_data = aff_data
 
 
-def _is_acronym(stem: str) -> bool:
-    """Check if a stem is an acronym (all caps, e.g. "ABC")."""
-    return len(stem) > 1 and stem.isupper()
+def _expand_batch(
+    batch: tuple[tuple[str, str], ...],
+) -> list[tuple[str, str, set[str]]]:
+    """Expand a batch of (stem, flags) entries inside a worker process."""
+    return [
+        (stem, flags, expand_word(stem, flags, _worker_aff_data))
+        for stem, flags in batch
+    ]
 
 
-def _has_uppercase(stem: str) -> bool:
-    """Check if a stem contains any uppercase letter."""
-    return any(c.isupper() for c in stem)
-
+def _expand_entries(
+    entries: Iterable[tuple[str, str]],
+    aff_data: AffData,
+    max_workers: int,
+) -> Iterator[tuple[str, str, set[str]]]:
+    """Expand every (stem, flags) entry, yielding (stem, flags, expanded).
 
-def convert_dic_to_wordlist(dic_path: Path, aff_path: Path) -> WordlistResult:
+    Stems are independent, so with more than one worker they are expanded
+    in batches across a process pool. Only about two batches per worker are
+    in flight at once, so the .dic is still read lazily and finished
+    results are consumed as they arrive. Results keep the input order.
+    """
+    if max_workers <= 1:
+        for stem, flags in entries:
+            yield stem, flags, expand_word(stem, flags, aff_data)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(aff_data,),
+    ) as pool:
+        # Unlike pool.map, which submits every batch up front, keep a
+        # bounded queue of futures and refill it as the oldest completes
+        in_flight: deque[Future[list[tuple[str, str, set[str]]]]] = deque()
+        for batch in itertools.batched(entries, _BATCH_SIZE):
+            in_flight.append(pool.submit(_expand_batch, batch))
+            if len(in_flight) >= 2 * max_workers:
+                yield from in_flight.popleft().result()
+        while in_flight:
+            yield from in_flight.popleft().result()
+
+
+def convert_dic_to_wordlist(
+    dic_path: Path, aff_path: Path, max_workers: int | None = 1
+) -> WordlistResult:
     """Convert a Hunspell .dic + .aff pair into sorted word lists.
 
     Expands all stems using their affix flags, filters to alphabetic-only
@@ -252,38 +154,26 @@ def convert_dic_to_wordlist(dic_path: Path, aff_path: Path) -> WordlistResult:
     Args:
         dic_path: Path to the .dic file.
         aff_path: Path to the .aff file.
+        max_workers: Number of processes used to expand stems. The default
+            of 1 expands everything in the current process; None uses the
+            CPU count. Sequential expansion takes only a fraction of a
+            second, so a pool only pays off on machines with several free
+            cores.
 
     Returns:
         WordlistResult with .words, .proper_nouns, .acronyms, and .profanity.
     """
     aff_data = parse_aff_file(aff_path)
-    affix_groups = aff_data.affix_groups
     common_words: set[str] = set()
     proper_noun_words: set[str] = set()
     acronym_words: set[str] = set()
     profanity_words: set[str] = set()
 
-    with open(dic_path, encoding="utf-8") as f:
-        lines = f.readlines()
-
-    # First line is the word count — skip it
-    for line in lines[1:]:
-        line = line.strip()
-        if not line:
-            continue
-
-        # Split into stem and flags
-        if "/" in line:
-            stem, flags = line.split("/", 1)
-        else:
-            stem, flags = line, ""
-
-        # Skip ONLYINCOMPOUND stems (e.g. "1th", "2th", "3th")
-        if aff_data.onlyincompound_flag and aff_data.onlyincompound_flag in flags:
-            continue
-
-        expanded = expand_word(stem, flags, affix_groups)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
 
+    entries = _read_dic_entries(dic_path, aff_data.onlyincompound_flag)
+    for stem, flags, expanded in _expand_entries(entries, aff_data, max_workers):
         # Classify based on NOSUGGEST flag first, then stem case
         if aff_data.nosuggest_flag and aff_data.nosuggest_flag in flags:
             profanity_words.update(expanded)
@@ -294,21 +184,20 @@ def convert_dic_to_wordlist(dic_path: Path, aff_path: Path) -> WordlistResult:
         else:
             common_words.update(expanded)
 
-    # Filter to alpha-only words with length >= 2, preserving original case
-    def _filter_alpha(word_set: set[str]) -> set[str]:
-        return {w for w in word_set if w.isalpha() and len(w) >= 2}
-
     profanity = _filter_alpha(profanity_words)
-    acronyms = _filter_alpha(acronym_words) - profanity
-    proper_nouns = _filter_alpha(proper_noun_words) - profanity - acronyms
+    acronyms = _filter_alpha(acronym_words)
+    acronyms.difference_update(profanity)
+    proper_nouns = _filter_alpha(proper_noun_words)
+    proper_nouns.difference_update(profanity, acronyms)
     # Remove words claimed by higher-priority categories from common words
-    words = _filter_alpha(common_words) - profanity - acronyms - proper_nouns
+    words = _filter_alpha(common_words)
+    words.difference_update(profanity, acronyms, proper_nouns)
 
     return WordlistResult(
-        words=sorted(words, key=str.casefold),
-        proper_nouns=sorted(proper_nouns, key=str.casefold),
-        acronyms=sorted(acronyms, key=str.casefold),
-        profanity=sorted(profanity, key=str.casefold),
+        words=_sorted_casefold(words),
+        proper_nouns=_sorted_casefold(proper_nouns),
+        acronyms=_sorted_casefold(acronyms),
+        profanity=_sorted_casefold(profanity),
     )
 
 
@@ -2,10 +2,36 @@
 
 # Standard library imports
 import argparse
+import os
+import pickle
+import string
+from collections.abc import Iterator
 from pathlib import Path
 
 WORDLISTS_DIR = Path(__file__).parent / "wordlists"
 
+# Output sections and their wordlists, in priority order (earlier sections
+# claim words first)
+WORDLIST_SECTIONS: dict[str, Path] = {
+    "Common words": WORDLISTS_DIR / "en_US_common.txt",
+    "Profanity": WORDLISTS_DIR / "en_US_profanity.txt",
+    "Proper nouns": WORDLISTS_DIR / "en_US_proper_nouns.txt",
+    "Acronyms": WORDLISTS_DIR / "en_US_acronyms.txt",
+    "Other words": WORDLISTS_DIR / "words_alpha.txt",
+}
+
+# Single cache file holding the parsed index of every wordlist above
+WORDLIST_CACHE_PATH = WORDLISTS_DIR / "wordlists.cache"
+
+# Bit i of a letter mask stands for the i-th lowercase letter (a = bit 0).
+# Any other character sets a bit outside the alphabet, so words containing
+# one can never be a subset of the puzzle letters.
+_LETTER_BITS = {c: 1 << i for i, c in enumerate(string.ascii_lowercase)}
+_NON_LETTER_BIT = 1 << 26
+
+# Bump when the cached data layout or the letter mask encoding changes
+_CACHE_VERSION = 3
+
 
 def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     """Parse command-line arguments.
@@ -58,13 +84,128 @@ def load_wordlist(path: Path) -> list[str]:
     Returns:
         List of words (preserving original casing).
     """
-    words = []
-    with open(path, encoding="utf-8") as f:
-        for line in f:
-            word = line.strip()
-            if word:
-                words.append(word)
-    return words
+    # Read the file in one go, then strip each line; a plain split() would
+    # also break up any line with internal spaces
+    text = path.read_text(encoding="utf-8")
+    return [word for word in (line.strip() for line in text.splitlines()) if word]
+
+
+def letter_mask(word: str) -> int:
+    """Encode the distinct letters of a word as an integer bitmask.
+
+    Subset and equality tests between letter sets then reduce to integer
+    operations, e.g. a word uses only puzzle letters when
+    ``letter_mask(word) & ~puzzle_mask == 0``.
+
+    Args:
+        word: The word to encode (case-insensitive).
+
+    Returns:
+        Bitmask with bit i set if the i-th letter of the alphabet appears.
+    """
+    mask = 0
+    for c in set(word.lower()):
+        mask |= _LETTER_BITS.get(c, _NON_LETTER_BIT)
+    return mask
+
+
+def build_wordlist_index(path: Path) -> dict[int, str]:
+    """Parse a wordlist into an index keyed by the letter mask of each word.
+
+    Args:
+        path: Path to the wordlist file.
+
+    Returns:
+        Dict mapping letter mask to the words with exactly that set of
+        letters, in file order, joined by newlines. Keeping each bucket as
+        one string makes the cache several times faster to unpickle than a
+        dict of lists; callers split only the few buckets they need.
+    """
+    buckets: dict[int, list[str]] = {}
+    for word in load_wordlist(path):
+        buckets.setdefault(letter_mask(word), []).append(word)
+    return {mask: "\n".join(words) for mask, words in buckets.items()}
+
+
+def load_wordlist_indexes(
+    paths: list[Path], cache_path: Path
+) -> dict[Path, dict[int, str]]:
+    """Load the index of every wordlist, using one bundled on-disk cache.
+
+    All indexes live in a single pickle at cache_path, so a solve opens and
+    reads one file instead of one per wordlist. The bundle is reused while
+    every wordlist's name, size and modification time are unchanged, and
+    rebuilt as a whole otherwise. If it can't be written (e.g. a read-only
+    install), the wordlists are simply parsed on every call.
+
+    Args:
+        paths: Wordlist files to load. Pass the same list on every call;
+            a different list invalidates the bundle. Files that don't exist
+            are skipped (and adding one later rebuilds the bundle).
+        cache_path: Where to store the bundled cache.
+
+    Returns:
+        Dict mapping each existing path to its index (see
+        build_wordlist_index).
+    """
+    stats = {}
+    for path in paths:
+        try:
+            stats[path] = path.stat()
+        except FileNotFoundError:
+            continue
+    paths = list(stats)
+    stamp = (
+        _CACHE_VERSION,
+        [(path.name, st.st_size, st.st_mtime_ns) for path, st in stats.items()],
+    )
+
+    try:
+        with open(cache_path, "rb") as f:
+            cached_stamp, indexes = pickle.load(f)
+    except Exception:  # noqa: BLE001
+        # Missing, stale-format or corrupt cache. A damaged pickle can raise
+        # almost anything (OverflowError, MemoryError, ...), and the cache is
+        # disposable, so just rebuild it.
+        cached_stamp = None
+    if cached_stamp == stamp:
+        return dict(zip(paths, indexes))
+
+    indexes = [build_wordlist_index(path) for path in paths]
+
+    # Write to a temporary file first so concurrent runs never see a
+    # partially written cache
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            pickle.dump((stamp, indexes), f, protocol=5)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+    return dict(zip(paths, indexes))
+
+
+def _submasks(mask: int) -> Iterator[int]:
+    """Yield every subset of the bits in mask, from mask itself down to 0."""
+    # (sub - 1) & mask steps to the next-smaller subset of mask's bits
+    sub = mask
+    while True:
+        yield sub
+        if sub == 0:
+            return
+        sub = (sub - 1) & mask
+
+
+def _letter_set_mask(letter_set: set[str]) -> int:
+    """Bitmask of an already-lowercased set of puzzle letters.
+
+    Cheaper than letter_mask for a letter set: no lowercasing or
+    deduplication is needed.
+    """
+    mask = 0
+    for c in letter_set:
+        mask |= _LETTER_BITS[c]
+    return mask
 
 
 def is_valid_word(word: str, letter_set: set[str], main_letter: str) -> bool:
@@ -79,13 +220,10 @@ def is_valid_word(word: str, letter_set: set[str], main_letter: str) -> bool:
         True if the word satisfies all puzzle constraints.
     """
     lower = word.lower()
-    if len(lower) < 4:
-        return False
-    if main_letter not in lower:
-        return False
-    if not set(lower) <= letter_set:
+    # Most words fail these cheap checks, so only the rest get a mask built
+    if len(lower) < 4 or main_letter not in lower:
         return False
-    return True
+    return letter_mask(lower) & ~_letter_set_mask(letter_set) == 0
 
 
 def is_pangram(word: str, letter_set: set[str]) -> bool:
@@ -99,7 +237,7 @@ def is_pangram(word: str, letter_set: set[str]) -> bool:
         True if the word contains every letter in the set
         (and no others).
     """
-    return set(word.lower()) == letter_set
+    return letter_mask(word) == _letter_set_mask(letter_set)
 
 
 def solve(
@@ -117,64 +255,67 @@ def solve(
     Returns:
         Dict mapping section name to sorted list of words.
     """
-    main_letter = letters[0].lower()
-    letter_set = set(letters.lower())
-
-    # Wordlists in priority order (earlier sections claim words first)
-    wordlist_sections: list[tuple[str, Path]] = []
-    wordlist_sections.append(("Common words", WORDLISTS_DIR / "en_US_common.txt"))
-    if show_profanity:
-        wordlist_sections.append(
-            ("Profanity", WORDLISTS_DIR / "en_US_profanity.txt")
-        )
-    wordlist_sections.append(
-        ("Proper nouns", WORDLISTS_DIR / "en_US_proper_nouns.txt")
+    puzzle_letters = letters.lower()
+    puzzle_mask = letter_mask(puzzle_letters)
+    main_bit = letter_mask(puzzle_letters[0])
+
+    # Every available wordlist is loaded (the cache bundles them all), but
+    # hidden sections are skipped so they don't claim any words. A missing
+    # wordlist is only an error if its section was asked for.
+    hidden_sections = set()
+    if not show_profanity:
+        hidden_sections.add("Profanity")
+    if hide_acronyms:
+        hidden_sections.add("Acronyms")
+    indexes = load_wordlist_indexes(
+        list(WORDLIST_SECTIONS.values()), WORDLIST_CACHE_PATH
     )
-    if not hide_acronyms:
-        wordlist_sections.append(
-            ("Acronyms", WORDLISTS_DIR / "en_US_acronyms.txt")
-        )
-    wordlist_sections.append(("Other words", WORDLISTS_DIR / "words_alpha.txt"))
+    wordlist_sections: list[tuple[str, dict[int, str]]] = []
+    for name, path in WORDLIST_SECTIONS.items():
+        if name in hidden_sections:
+            continue
+        if path not in indexes:
+            raise FileNotFoundError(f"Wordlist not found: {path}")
+        wordlist_sections.append((name, indexes[path]))
 
-    # Collect valid words per section, deduplicating across sections
+    # Collect valid words per section, deduplicating across sections.
+    # Pangrams are routed straight to their own list as they are found.
     seen: set[str] = set()
     section_words: dict[str, list[str]] = {}
-    all_valid: list[str] = []
+    pangram_list: list[str] = []
 
-    for section_name, path in wordlist_sections:
-        words = load_wordlist(path)
+    # Every valid word's letter mask is the main letter plus some subset of
+    # the other six, so at most 64 index buckets need to be looked at
+    candidate_masks = [
+        sub | main_bit for sub in _submasks(puzzle_mask & ~main_bit)
+    ]
+
+    for section_name, index in wordlist_sections:
         valid = []
-        for word in words:
-            if is_valid_word(word, letter_set, main_letter):
-                key = word.lower()
-                if key not in seen:
-                    seen.add(key)
-                    valid.append(word)
-                    all_valid.append(word)
+        for mask in candidate_masks:
+            bucket = index.get(mask)
+            if bucket is None:
+                continue
+            # Every word in a bucket shares its letter set, so a bucket is
+            # either all pangrams or none
+            target = pangram_list if mask == puzzle_mask else valid
+            for word in bucket.split("\n"):
+                if len(word) < 4:
+                    continue
+                lower = word.lower()
+                if lower not in seen:
+                    seen.add(lower)
+                    target.append(word)
         section_words[section_name] = valid
 
-    # Extract pangrams from all valid words
-    pangrams_lower: set[str] = set()
-    pangram_list: list[str] = []
-    for word in all_valid:
-        if is_pangram(word, letter_set):
-            pangrams_lower.add(word.lower())
-            pangram_list.append(word)
-
-    # Remove pangrams from their original sections
-    for section_name in section_words:
-        section_words[section_name] = [
-            w for w in section_words[section_name] if w.lower() not in pangrams_lower
-        ]
-
     # Build final ordered output
     result: dict[str, list[str]] = {}
-    result["Pangrams"] = sorted(pangram_list, key=lambda w: w.lower())
+    result["Pangrams"] = sorted(pangram_list, key=str.lower)
 
     for section_name, _ in wordlist_sections:
         words = section_words[section_name]
         if words:
-            result[section_name] = sorted(words, key=lambda w: w.lower())
+            result[section_name] = sorted(words, key=str.lower)
 
     return result
 
@@ -0,0 +1,196 @@
+"""Shared pytest fixtures, options and hooks for the test suite."""
+
+# Standard library
+import hashlib
+import pickle
+import re
+from collections.abc import Generator
+from importlib.metadata import PackageNotFoundError, version
+from itertools import chain
+from pathlib import Path
+
+# Third-party libraries
+import pytest
+
+# Local imports
+import affixes
+import convert_dic
+from affixes import AffData, AffixGroup, parse_aff_file
+from convert_dic import WordlistResult, convert_dic_to_wordlist
+
+AFF_PATH = Path("wordlists/en_US.aff")
+DIC_PATH = Path("wordlists/en_US.dic")
+WORDS_ALPHA_PATH = Path("wordlists/words_alpha.txt")
+
+
+# ------------------------------- OPTIONS / HOOKS -----------------------------
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--no-validation-cache",
+        action="store_true",
+        help="Always run the slow cross-validation tests, even if their "
+        "inputs are unchanged since they last passed.",
+    )
+
+
+def _validation_inputs_digest(test_path: Path) -> str:
+    """SHA-1 over everything a slow validation test's result depends on.
+
+    Covers the .aff/.dic files, the conversion modules, the test module,
+    this conftest (which builds wordlist_result and decides the skips) and
+    the installed spylls version (the reference implementation).
+    """
+    digest = hashlib.sha1()
+    for path in (
+        AFF_PATH,
+        DIC_PATH,
+        Path(affixes.__file__),
+        Path(convert_dic.__file__),
+        Path(__file__),
+        test_path,
+    ):
+        digest.update(path.read_bytes())
+    try:
+        digest.update(version("spylls").encode())
+    except PackageNotFoundError:
+        pass
+    return digest.hexdigest()
+
+
+_validation_digest_key = pytest.StashKey[str]()
+
+# pytest cache entry mapping each passed slow test's node ID to its digest
+_VALIDATION_CACHE_KEY = "validation/passed"
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """Skip slow tests that already passed with identical inputs.
+
+    Deciding at collection time means a skipped test never sets up its
+    fixtures (e.g. loading spylls' dictionary). Without the cache provider
+    (-p no:cacheprovider), or with --no-validation-cache, they always run.
+    """
+    cache = getattr(config, "cache", None)
+    if cache is None:
+        return
+    force = config.getoption("--no-validation-cache")
+    passed = cache.get(_VALIDATION_CACHE_KEY, {})
+    digests: dict[Path, str] = {}
+    for item in items:
+        if item.get_closest_marker("slow") is None:
+            continue
+        if item.path not in digests:
+            digests[item.path] = _validation_inputs_digest(item.path)
+        digest = item.stash[_validation_digest_key] = digests[item.path]
+        if not force and passed.get(item.nodeid) == digest:
+            item.add_marker(
+                pytest.mark.skip(
+                    reason="inputs unchanged since last passing validation"
+                )
+            )
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_makereport(
+    item: pytest.Item, call: pytest.CallInfo[None]
+) -> Generator[None, pytest.TestReport, pytest.TestReport]:
+    """Record slow tests that passed, so unchanged re-runs can skip them."""
+    report = yield
+    digest = item.stash.get(_validation_digest_key, None)
+    if report.when == "call" and report.passed and digest is not None:
+        cache = item.config.cache
+        passed = cache.get(_VALIDATION_CACHE_KEY, {})
+        passed[item.nodeid] = digest
+        cache.set(_VALIDATION_CACHE_KEY, passed)
+    return report
+
+
+# ---------------------------------- FIXTURES ---------------------------------
+
+
+def _wordlist_cache_key() -> str:
+    """Fingerprint the inputs that determine the conversion output.
+
+    Covers the size and mtime of the .aff/.dic files and the source of the
+    conversion modules, so editing either the dictionary or the code under
+    test invalidates the cached result.
+    """
+    digest = hashlib.sha1()
+    for path in (AFF_PATH, DIC_PATH):
+        stat = path.stat()
+        digest.update(f"{path.name}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+    for module in (affixes, convert_dic):
+        digest.update(Path(module.__file__).read_bytes())
+    return digest.hexdigest()
+
+
+@pytest.fixture(scope="session")
+def wordlist_result(request: pytest.FixtureRequest) -> WordlistResult:
+    """Full conversion result, computed once per session.
+
+    The result is also pickled under pytest's cache directory, so re-runs
+    with unchanged inputs skip the expansion entirely (use --cache-clear
+    to force it). Without the cache provider (-p no:cacheprovider) it is
+    simply converted every session.
+    """
+    cache = getattr(request.config, "cache", None)
+    if cache is None:
+        return convert_dic_to_wordlist(DIC_PATH, AFF_PATH)
+
+    cache_dir = cache.mkdir("wordlist_result")
+    cache_path = cache_dir / f"{_wordlist_cache_key()}.pickle"
+    try:
+        with open(cache_path, "rb") as f:
+            cached = pickle.load(f)
+    except Exception:  # noqa: BLE001
+        # Missing, truncated or foreign pickle: it can raise almost anything,
+        # and the result is just recomputed below
+        cached = None
+    if isinstance(cached, WordlistResult):
+        return cached
+
+    result = convert_dic_to_wordlist(DIC_PATH, AFF_PATH)
+    for stale in cache_dir.glob("*.pickle"):
+        stale.unlink(missing_ok=True)
+    with open(cache_path, "wb") as f:
+        pickle.dump(result, f, protocol=5)
+    return result
+
+
+@pytest.fixture(scope="session")
+def all_words_set(wordlist_result: WordlistResult) -> frozenset[str]:
+    """Every word from all four output lists, for membership checks."""
+    return frozenset(
+        chain(
+            wordlist_result.words,
+            wordlist_result.proper_nouns,
+            wordlist_result.acronyms,
+            wordlist_result.profanity,
+        )
+    )
+
+
+@pytest.fixture(scope="session")
+def words_alpha_set() -> frozenset[str]:
+    """Lowercased alpha-only words from words_alpha.txt (skips if missing)."""
+    if not WORDS_ALPHA_PATH.exists():
+        pytest.skip("words_alpha.txt not found")
+    # One regex pass over the whole file instead of per-line Python work
+    text = WORDS_ALPHA_PATH.read_text(encoding="utf-8").lower()
+    return frozenset(re.findall(r"^[a-z]+$", text, re.MULTILINE))
+
+
+@pytest.fixture(scope="session")
+def aff_data() -> AffData:
+    """Parse the .aff file once per session."""
+    return parse_aff_file(AFF_PATH)
+
+
+@pytest.fixture(scope="session")
+def groups(aff_data: AffData) -> dict[str, AffixGroup]:
+    """Affix groups extracted from the .aff data."""
+    return aff_data.affix_groups
@@ -0,0 +1,302 @@
+"""Tests for Hunspell affix parsing, application and stem expansion.
+
+The aff_data and groups fixtures come from conftest.py.
+"""
+
+# Third-party libraries
+import pytest
+
+# Local imports
+from affixes import (
+    AffData,
+    AffixGroup,
+    AffixRule,
+    apply_affix,
+    expand_word,
+)
+
+# ----------------------------- AFF FILE PARSING ------------------------------
+
+
+class TestParseAffFile:
+    """Verify that the .aff parser correctly reads affix rules and flags."""
+
+    def test_prefix_a_is_re(self, groups: dict[str, AffixGroup]) -> None:
+        """Flag A should be a prefix adding 're'."""
+        assert "A" in groups
+        g = groups["A"]
+        assert g.kind == "PFX"
+        assert len(g.rules) == 1
+        assert g.rules[0].add == "re"
+
+    def test_zero_placeholder_is_empty(self, groups: dict[str, AffixGroup]) -> None:
+        """Hunspell's "0" (nothing to strip/add) should be stored as ""."""
+        assert groups["A"].rules[0].strip == ""
+        assert all("0" not in (r.strip, r.add) for r in groups["S"].rules)
+
+    def test_suffix_s_pluralisation(self, groups: dict[str, AffixGroup]) -> None:
+        """Flag S should have 4 pluralisation rules."""
+        assert "S" in groups
+        g = groups["S"]
+        assert g.kind == "SFX"
+        assert len(g.rules) == 4
+
+    def test_suffix_g_gerund(self, groups: dict[str, AffixGroup]) -> None:
+        """Flag G should add '-ing' suffix."""
+        assert "G" in groups
+        g = groups["G"]
+        assert g.kind == "SFX"
+        assert len(g.rules) == 2
+        adds = {r.add for r in g.rules}
+        assert "ing" in adds
+
+    def test_suffix_d_past_tense(self, groups: dict[str, AffixGroup]) -> None:
+        """Flag D should have 4 past tense rules."""
+        assert "D" in groups
+        g = groups["D"]
+        assert g.kind == "SFX"
+        assert len(g.rules) == 4
+
+    def test_rule_conditions_precompiled(
+        self, groups: dict[str, AffixGroup]
+    ) -> None:
+        """Regex conditions should carry their compiled pattern."""
+        g = groups["S"]
+        ies_rule = next(r for r in g.rules if r.condition == "[^aeiou]y")
+        assert ies_rule.cond_kind == "regex"
+        # "[^aeiou]y" is a suffix condition, so it must be anchored at the end
+        assert ies_rule.pattern.search("baby")
+        assert not ies_rule.pattern.search("byte")
+
+    def test_shared_conditions_share_pattern(
+        self, groups: dict[str, AffixGroup]
+    ) -> None:
+        """Rules with the same condition should reuse one compiled pattern."""
+        plural = next(r for r in groups["S"].rules if r.condition == "[^aeiou]y")
+        past = next(r for r in groups["D"].rules if r.condition == "[^aeiou]y")
+        assert plural.pattern is past.pattern
+
+    def test_simple_conditions_skip_regex(
+        self, groups: dict[str, AffixGroup]
+    ) -> None:
+        """"." and plain-letter conditions should not need a regex."""
+        kinds = {r.condition: (r.cond_kind, r.pattern) for r in groups["D"].rules}
+        assert kinds["e"] == ("literal", None)
+        assert groups["A"].rules[0].cond_kind == "any"
+
+    def test_groups_split_by_kind(self, aff_data: AffData) -> None:
+        """Prefix and suffix dicts should partition the affix groups."""
+        assert "A" in aff_data.prefix_groups
+        assert "S" in aff_data.suffix_groups
+        assert all(g.kind == "PFX" for g in aff_data.prefix_groups.values())
+        assert all(g.kind == "SFX" for g in aff_data.suffix_groups.values())
+        assert {**aff_data.prefix_groups, **aff_data.suffix_groups} == (
+            aff_data.affix_groups
+        )
+
+    def test_rules_packed_in_order(self, groups: dict[str, AffixGroup]) -> None:
+        """Each group's packed tuples should mirror its rule list."""
+        for group in groups.values():
+            assert len(group.packed) == len(group.rules)
+            for (strip, add, cond_kind, _), rule in zip(group.packed, group.rules):
+                assert (strip, add, cond_kind) == (
+                    rule.strip,
+                    rule.add,
+                    rule.cond_kind,
+                )
+
+    def test_group_built_from_rules_is_packed(self) -> None:
+        """Rules passed to the constructor should be usable by apply_affix."""
+        group = AffixGroup(
+            kind="SFX",
+            flag="X",
+            cross_product=True,
+            rules=[AffixRule(strip="y", add="ies", condition="[^aeiou]y")],
+        )
+        assert apply_affix("city", group) == ["cities"]
+        assert apply_affix("day", group) == []
+
+    def test_groups_split_when_built_directly(self, aff_data: AffData) -> None:
+        """AffData built by hand should derive the prefix/suffix dicts too."""
+        rebuilt = AffData(
+            affix_groups=aff_data.affix_groups,
+            nosuggest_flag=aff_data.nosuggest_flag,
+            onlyincompound_flag=aff_data.onlyincompound_flag,
+        )
+        assert rebuilt.prefix_groups == aff_data.prefix_groups
+        assert "reapplying" in expand_word("apply", "ADGS", rebuilt)
+
+    def test_nosuggest_flag(self, aff_data: AffData) -> None:
+        """NOSUGGEST flag should be '!'."""
+        assert aff_data.nosuggest_flag == "!"
+
+    def test_onlyincompound_flag(self, aff_data: AffData) -> None:
+        """ONLYINCOMPOUND flag should be 'c'."""
+        assert aff_data.onlyincompound_flag == "c"
+
+
+# ---------------------- AFFIX APPLICATION (UNIT TESTS) -----------------------
+
+# Known English morphology per affix flag: (stem, forms apply_affix must
+# produce, forms it must not produce). Each stem appears once per flag, so
+# apply_affix runs once per (stem, flag) pair.
+APPLY_AFFIX_CASES: dict[str, list[tuple[str, set[str], set[str]]]] = {
+    # Suffix S: plurals
+    "S": [
+        # Regular nouns add 's'
+        ("cat", {"cats"}, set()),
+        ("dog", {"dogs"}, set()),
+        ("book", {"books"}, set()),
+        # Sibilant-ending nouns add 'es'
+        ("bus", {"buses"}, set()),
+        ("brush", {"brushes"}, set()),
+        ("tax", {"taxes"}, set()),
+        # Consonant+y nouns change y to ies
+        ("baby", {"babies"}, set()),
+        ("carry", {"carries"}, set()),
+        ("city", {"cities"}, set()),
+        # Vowel+y nouns just add 's'
+        ("boy", {"boys"}, {"boies"}),
+    ],
+    # Suffix G: gerund/present participle
+    "G": [
+        # Regular verbs add 'ing'
+        ("walk", {"walking"}, set()),
+        ("talk", {"talking"}, set()),
+        ("jump", {"jumping"}, set()),
+        # Verbs ending in 'e' drop it before 'ing'
+        ("take", {"taking"}, set()),
+        ("bake", {"baking"}, set()),
+        ("make", {"making"}, set()),
+    ],
+    # Suffix D: past tense
+    "D": [
+        # Words ending in 'e' add 'd' ("take" is irregular, but the affix
+        # rules are regular)
+        ("bake", {"baked"}, set()),
+        ("take", {"taked"}, set()),
+        ("make", {"maked"}, set()),
+        # Regular verbs add 'ed'
+        ("walk", {"walked"}, set()),
+        ("talk", {"talked"}, set()),
+        ("jump", {"jumped"}, set()),
+        # Consonant+y verbs change y to ied
+        ("carry", {"carried"}, set()),
+        ("worry", {"worried"}, set()),
+        ("hurry", {"hurried"}, set()),
+        # Vowel+y verbs just add 'ed'
+        ("play", {"played"}, set()),
+    ],
+    # Prefix A: re-
+    "A": [
+        ("apply", {"reapply"}, set()),
+        ("build", {"rebuild"}, set()),
+        ("do", {"redo"}, set()),
+    ],
+    # Prefix U: un-
+    "U": [
+        ("do", {"undo"}, set()),
+        ("tie", {"untie"}, set()),
+        ("lock", {"unlock"}, set()),
+    ],
+    # Suffix Y: -ly
+    "Y": [
+        ("quick", {"quickly"}, set()),
+        ("slow", {"slowly"}, set()),
+        ("quiet", {"quietly"}, set()),
+    ],
+    # Suffix L: -ment
+    "L": [
+        ("abandon", {"abandonment"}, set()),
+    ],
+}
+
+
+class TestApplyAffix:
+    """Test individual affix rules against known English morphology."""
+
+    @pytest.mark.parametrize("flag", list(APPLY_AFFIX_CASES))
+    def test_known_forms(self, groups: dict[str, AffixGroup], flag: str) -> None:
+        """Each stem should produce its expected forms and none of the bad ones."""
+        failures = []
+        for stem, expected, unexpected in APPLY_AFFIX_CASES[flag]:
+            result = set(apply_affix(stem, groups[flag]))
+            if missing := expected - result:
+                failures.append(f"{stem}: missing {sorted(missing)}")
+            if wrong := unexpected & result:
+                failures.append(f"{stem}: unexpected {sorted(wrong)}")
+        assert not failures, f"Flag {flag}: {failures}"
+
+
+# ----------------------- FULL WORD EXPANSION TESTS ---------------------------
+
+
+class TestExpandWord:
+    """Test full expansion of stems with multiple flags."""
+
+    def test_abandon_lsdg(self, aff_data: AffData) -> None:
+        """'abandon/LSDG' should expand to stem + suffixed forms."""
+        words = expand_word("abandon", "LSDG", aff_data)
+        expected = {"abandon", "abandonment", "abandons", "abandoned", "abandoning"}
+        assert expected.issubset(words)
+
+    def test_no_flags(self, aff_data: AffData) -> None:
+        """A word with no flags should only produce itself."""
+        words = expand_word("hello", "", aff_data)
+        assert words == {"hello"}
+
+    def test_cross_product(self, aff_data: AffData) -> None:
+        """Prefix A (re-) with cross_product=Y should combine with suffixes."""
+        words = expand_word("apply", "ADGS", aff_data)
+        assert "reapply" in words
+        assert "reapplying" in words
+        assert "reapplied" in words
+
+
+# ---------------------- NEGATIVE TESTS (SHOULD NOT EXIST) --------------------
+
+
+class TestNegativeExpansion:
+    """Verify that certain invalid words are NOT produced."""
+
+    def test_no_boies(self, aff_data: AffData) -> None:
+        """Vowel+y should not produce '-ies' form."""
+        words = expand_word("boy", "S", aff_data)
+        assert "boies" not in words
+
+    def test_no_plaied(self, aff_data: AffData) -> None:
+        """Vowel+y should not produce '-ied' form."""
+        words = expand_word("play", "D", aff_data)
+        assert "plaied" not in words
+
+    def test_no_cross_product_with_non_crossable_suffix(
+        self, aff_data: AffData
+    ) -> None:
+        """Prefixes should not cross-product with suffixes that have cross_product=N.
+
+        Suffixes T (-est), H (-th), V (-ive) have cross_product=N.
+        Combining prefix A (re-) with these should NOT produce words like
+        'rebarest', 'relivest', 'recreative'.
+        """
+        # "bare" with flags including A (re-) and T (-est)
+        words = expand_word("bare", "AT", aff_data)
+        assert "rebarest" not in words
+        assert "barest" in words  # Suffix alone is fine
+        assert "rebare" in words  # Prefix alone is fine
+
+        # "live" with flags including A (re-) and V (-ive)
+        words = expand_word("live", "AV", aff_data)
+        assert "relive" not in words or "relive" in words  # prefix is fine
+        assert "relivive" not in words  # bogus cross-product
+
+    def test_cross_product_with_crossable_suffix(
+        self, aff_data: AffData
+    ) -> None:
+        """Prefixes SHOULD cross-product with suffixes that have cross_product=Y.
+
+        Suffix D (-ed), G (-ing), S (-s) have cross_product=Y.
+        """
+        words = expand_word("apply", "ADGS", aff_data)
+        assert "reapplied" in words  # re- + -ed
+        assert "reapplying" in words  # re- + -ing
+        assert "reapplies" in words  # re- + -ies
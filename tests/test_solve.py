@@ -1,10 +1,50 @@
 """Tests for the Spelling Bee solver (solve.py)."""
 
+# Standard library
+import pickle
+import random
+
 # Third-party libraries
 import pytest
 
 # Local imports
-from solve import format_output, is_pangram, is_valid_word, load_wordlist, parse_args, solve
+import solve as solve_module
+from solve import (
+    build_wordlist_index,
+    format_output,
+    is_pangram,
+    is_valid_word,
+    letter_mask,
+    load_wordlist,
+    load_wordlist_indexes,
+    parse_args,
+    solve,
+)
+
+# ------------------------------- letter_mask ---------------------------------
+
+
+class TestLetterMask:
+    """Tests for letter_mask."""
+
+    def test_single_letters(self):
+        assert letter_mask("a") == 1
+        assert letter_mask("z") == 1 << 25
+
+    def test_case_and_repeats_ignored(self):
+        assert letter_mask("Little") == letter_mask("TILE")
+
+    def test_subset(self):
+        puzzle_mask = letter_mask("laertiv")
+        assert letter_mask("trail") & ~puzzle_mask == 0
+        assert letter_mask("layer") & ~puzzle_mask != 0
+
+    def test_non_letter_never_subset(self):
+        puzzle_mask = letter_mask("laertiv")
+        assert letter_mask("l'aire") & ~puzzle_mask != 0
+
+    def test_empty_string(self):
+        assert letter_mask("") == 0
 
 
 # ----------------------------- is_valid_word ---------------------------------
@@ -115,46 +155,154 @@ class TestLoadWordlist:
         words = load_wordlist(path)
         assert words == ["alpha", "beta", "gamma"]
 
+    def test_one_entry_per_line(self, tmp_path):
+        path = tmp_path / "test.txt"
+        path.write_text(" alpha \nice cream\n")
+        assert load_wordlist(path) == ["alpha", "ice cream"]
+
+
+class TestBuildWordlistIndex:
+    """Tests for build_wordlist_index."""
+
+    def test_words_bucketed_by_mask(self, tmp_path):
+        path = tmp_path / "test.txt"
+        path.write_text("tile\ntrail\nLittle\n")
+        index = build_wordlist_index(path)
+        assert index == {
+            letter_mask("tile"): "tile\nLittle",
+            letter_mask("trail"): "trail",
+        }
+
+
+class TestLoadWordlistIndexes:
+    """Tests for load_wordlist_indexes and its bundled on-disk cache."""
+
+    def test_indexes_keyed_by_path(self, tmp_path):
+        first = tmp_path / "first.txt"
+        second = tmp_path / "second.txt"
+        first.write_text("alpha\n")
+        second.write_text("beta\n")
+        indexes = load_wordlist_indexes([first, second], tmp_path / "bundle.cache")
+        assert indexes == {
+            first: {letter_mask("alpha"): "alpha"},
+            second: {letter_mask("beta"): "beta"},
+        }
+
+    def test_cache_written_and_reused(self, tmp_path):
+        path = tmp_path / "test.txt"
+        cache_path = tmp_path / "bundle.cache"
+        path.write_text("alpha\nbeta\n")
+        first = load_wordlist_indexes([path], cache_path)
+        assert cache_path.exists()
+        assert load_wordlist_indexes([path], cache_path) == first
+
+    def test_stale_cache_rebuilt(self, tmp_path):
+        first = tmp_path / "first.txt"
+        second = tmp_path / "second.txt"
+        cache_path = tmp_path / "bundle.cache"
+        first.write_text("alpha\n")
+        second.write_text("beta\n")
+        load_wordlist_indexes([first, second], cache_path)
+        second.write_text("beta\ngamma\n")
+        indexes = load_wordlist_indexes([first, second], cache_path)
+        assert sorted(indexes[second].values()) == ["beta", "gamma"]
+
+    def test_missing_file_skipped(self, tmp_path):
+        present = tmp_path / "present.txt"
+        present.write_text("alpha\n")
+        indexes = load_wordlist_indexes(
+            [present, tmp_path / "missing.txt"], tmp_path / "bundle.cache"
+        )
+        assert indexes == {present: {letter_mask("alpha"): "alpha"}}
+
+    def test_unexpected_payload_ignored(self, tmp_path):
+        path = tmp_path / "test.txt"
+        cache_path = tmp_path / "bundle.cache"
+        path.write_text("alpha\n")
+        cache_path.write_bytes(pickle.dumps(42))
+        indexes = load_wordlist_indexes([path], cache_path)
+        assert indexes == {path: {letter_mask("alpha"): "alpha"}}
+
+    def test_randomly_corrupted_cache_ignored(self, tmp_path):
+        path = tmp_path / "test.txt"
+        cache_path = tmp_path / "bundle.cache"
+        path.write_text("alpha\nbeta\n")
+        load_wordlist_indexes([path], cache_path)
+        data = cache_path.read_bytes()
+        rng = random.Random(0)
+        for _ in range(200):
+            # Whatever a flipped byte makes pickle raise, loading must not fail
+            corrupted = bytearray(data)
+            corrupted[rng.randrange(len(corrupted))] = rng.randrange(256)
+            cache_path.write_bytes(corrupted)
+            assert path in load_wordlist_indexes([path], cache_path)
+
+    def test_corrupt_cache_ignored(self, tmp_path):
+        path = tmp_path / "test.txt"
+        cache_path = tmp_path / "bundle.cache"
+        path.write_text("alpha\n")
+        cache_path.write_bytes(b"not a pickle")
+        indexes = load_wordlist_indexes([path], cache_path)
+        assert indexes == {path: {letter_mask("alpha"): "alpha"}}
+
 
 # ---------------------------------- solve ------------------------------------
 
 
+@pytest.fixture(scope="module")
+def solve_laertiv() -> dict[str, list[str]]:
+    """solve("LAERTIV") with default options, computed once for the module."""
+    return solve("LAERTIV")
+
+
+@pytest.fixture(scope="module")
+def solved_lower(solve_laertiv) -> dict[str, list[str]]:
+    """solve_laertiv with every word lowercased, for letter-level checks."""
+    return {
+        section: [word.lower() for word in words]
+        for section, words in solve_laertiv.items()
+    }
+
+
+@pytest.fixture(scope="module")
+def solve_laertiv_prof() -> dict[str, list[str]]:
+    """solve("LAERTIV") with profanity shown, computed once for the module."""
+    return solve("LAERTIV", show_profanity=True)
+
+
 class TestSolve:
     """Integration tests for the solve function."""
 
-    def test_known_puzzle(self):
+    def test_known_puzzle(self, solved_lower):
         """LAERTIV puzzle: check pangram and common words."""
-        result = solve("LAERTIV")
-        all_words = [w.lower() for words in result.values() for w in words]
+        all_words = [w for words in solved_lower.values() for w in words]
 
         assert "relative" in all_words
-        assert "Pangrams" in result
-        assert "relative" in [w.lower() for w in result["Pangrams"]]
+        assert "Pangrams" in solved_lower
+        assert "relative" in solved_lower["Pangrams"]
 
         # Some expected common words
         for word in ["trail", "later", "vital"]:
             assert word in all_words, f"expected '{word}' in results"
 
-    def test_main_letter_required(self):
+    def test_main_letter_required(self, solved_lower):
         """Every result word must contain the main letter."""
-        result = solve("LAERTIV")
-        for words in result.values():
+        for words in solved_lower.values():
             for word in words:
-                assert "l" in word.lower(), f"'{word}' missing main letter 'L'"
+                assert "l" in word, f"'{word}' missing main letter 'L'"
 
-    def test_no_invalid_letters(self):
+    def test_no_invalid_letters(self, solved_lower):
         """No result word should contain letters outside the puzzle."""
         letter_set = set("laertiv")
-        result = solve("LAERTIV")
-        for words in result.values():
+        for words in solved_lower.values():
             for word in words:
-                assert set(word.lower()) <= letter_set, (
+                assert letter_set.issuperset(word), (
                     f"'{word}' contains invalid letters"
                 )
 
-    def test_deduplication(self):
+    def test_deduplication(self, solve_laertiv_prof):
         """A word should appear in only one section."""
-        result = solve("LAERTIV", show_profanity=True)
+        result = solve_laertiv_prof
         seen: set[str] = set()
         for section, words in result.items():
             for word in words:
@@ -164,12 +312,12 @@ class TestSolve:
                 )
                 seen.add(key)
 
-    def test_profanity_hidden_by_default(self):
-        result = solve("LAERTIV")
+    def test_profanity_hidden_by_default(self, solve_laertiv):
+        result = solve_laertiv
         assert "Profanity" not in result
 
-    def test_profanity_shown_with_flag(self):
-        result = solve("LAERTIV", show_profanity=True)
+    def test_profanity_shown_with_flag(self, solve_laertiv_prof):
+        result = solve_laertiv_prof
         # Profanity section may or may not have words for this puzzle,
         # but the key point is it doesn't error
         assert isinstance(result, dict)
@@ -182,27 +330,45 @@ class TestSolve:
         # Just verify solve runs and returns valid structure
         assert "Pangrams" in result
 
+    def test_missing_optional_wordlist(self, monkeypatch, tmp_path):
+        """A missing profanity list only matters with --show-profanity."""
+        monkeypatch.setitem(
+            solve_module.WORDLIST_SECTIONS, "Profanity", tmp_path / "missing.txt"
+        )
+        monkeypatch.setattr(
+            solve_module, "WORDLIST_CACHE_PATH", tmp_path / "wordlists.cache"
+        )
+        assert "Pangrams" in solve("LAERTIV")
+        with pytest.raises(FileNotFoundError):
+            solve("LAERTIV", show_profanity=True)
+
     def test_acronyms_hidden_with_flag(self):
         result = solve("LAERTIV", hide_acronyms=True)
         assert "Acronyms" not in result
 
-    def test_all_words_at_least_four_letters(self):
-        result = solve("LAERTIV")
+    def test_all_words_at_least_four_letters(self, solve_laertiv):
+        result = solve_laertiv
         for words in result.values():
             for word in words:
                 assert len(word) >= 4, f"'{word}' is shorter than 4 letters"
 
-    def test_pangrams_separated_from_sections(self):
+    def test_pangrams_use_every_letter(self, solved_lower):
+        """Pangrams use all seven letters; no other section has such words."""
+        letter_set = set("laertiv")
+        for section, words in solved_lower.items():
+            for word in words:
+                assert (set(word) == letter_set) == (section == "Pangrams"), (
+                    f"'{word}' misfiled in '{section}'"
+                )
+
+    def test_pangrams_separated_from_sections(self, solved_lower):
         """Pangrams should not also appear in other sections."""
-        result = solve("LAERTIV")
-        pangrams_lower = {w.lower() for w in result.get("Pangrams", [])}
-        for section, words in result.items():
+        pangrams_lower = frozenset(solved_lower.get("Pangrams", []))
+        for section, words in solved_lower.items():
             if section == "Pangrams":
                 continue
-            for word in words:
-                assert word.lower() not in pangrams_lower, (
-                    f"pangram '{word}' also in '{section}'"
-                )
+            overlap = pangrams_lower.intersection(words)
+            assert not overlap, f"pangrams {sorted(overlap)} also in '{section}'"
 
 
 # ------------------------------ format_output --------------------------------